@@ -1,8 +1,11 @@
 # main.py - Complete integrated MCP Bridge Desktop with SSE MCP Server
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import threading
 import time
@@ -10,28 +13,49 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from contextlib import asynccontextmanager
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import FileResponse, JSONResponse, HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
 from mcp_bridge import MCPBridge
 from sse_server import create_sse_server
 from mcp.server.fastmcp import FastMCP
 
-# Configure logging
+# Configure logging - handlers drain on a QueueListener thread so file/console
+# writes never block the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('mcp_bridge.log', encoding='utf-8'),
+    logging.StreamHandler(),
+    respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('mcp_bridge.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# uvicorn[standard] ships uvloop and httptools; select them explicitly so both
+# servers skip the pure-Python event loop and HTTP parser when available.
+try:
+    import uvloop
+    UVICORN_LOOP = "uvloop"
+except ImportError:
+    UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "h11"
+
 # Data models
 class MCPServerConfig(BaseModel):
     name: str
@@ -57,6 +81,66 @@ class AppSettings(BaseModel):
 class MCPServerJSON(BaseModel):
     json_content: str
 
+# Lean ASGI CORS middleware shared by the management and SSE apps. Both use
+# the same allow-everything policy, so the response headers are precomputed
+# bytes instead of being rebuilt through Starlette's Headers machinery on
+# every request.
+class WildcardCORSMiddleware:
+    _CORS_HEADERS = [
+        (b"access-control-allow-credentials", b"true"),
+        (b"vary", b"origin"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin)] + self._CORS_HEADERS
+
+        # Preflight: answer directly without entering the app. With
+        # credentials allowed, browsers treat '*' in allow-methods and
+        # allow-headers as a literal token, so echo the requested values
+        request_method = headers.get(b"access-control-request-method")
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            preflight_headers = cors_headers + [
+                (b"access-control-allow-methods", request_method),
+                (b"content-length", b"0"),
+            ]
+            request_headers = headers.get(b"access-control-request-headers")
+            if request_headers:
+                preflight_headers.append(
+                    (b"access-control-allow-headers", request_headers)
+                )
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": preflight_headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+class ExecuteToolRequest(BaseModel):
+    name: str
+    server: str
+    arguments: Dict[str, Any] = {}
+
 # Get application directory
 if getattr(sys, 'frozen', False):
     APP_DIR = Path(sys._MEIPASS)
@@ -68,13 +152,70 @@ else:
 DATA_DIR.mkdir(exist_ok=True)
 CONFIG_FILE = DATA_DIR / "servers.json"
 
+# strftime re-runs C locale formatting on every call; cache the rendered
+# timestamp per wall-clock second so bursts of status updates reuse it
+_last_ts_second = 0
+_last_ts_str = ""
+
+def _now_str() -> str:
+    global _last_ts_second, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_ts_second = now
+    return _last_ts_str
+
 # Global instances
 bridge = MCPBridge()
 server_configs: Dict[str, MCPServerConfig] = {}
 server_statuses: Dict[str, ServerStatus] = {}
+# Names of currently running servers, maintained incrementally by the status
+# callback so /api/status doesn't rescan server_statuses per poll
+_running_servers: set = set()
 app_settings = AppSettings()
+# Formatted once per settings change rather than per /api/status request
+_sse_endpoint_url = f"http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}"
+# Settings only change on POST /api/settings; serve GETs from constant bytes
+_settings_cached = orjson.dumps(app_settings.model_dump())
 sse_mcp_bridge = None
 external_sse_server = None
+external_sse_task = None
+
+# Cached view of bridge.get_all_tools() - the tool list only changes when a
+# server starts/stops, so polling endpoints reuse it via a dirty flag
+_tools_cache: Optional[List[Dict[str, Any]]] = None
+_tools_dirty = True
+
+def _invalidate_tools_cache():
+    global _tools_dirty
+    _tools_dirty = True
+
+async def _cached_tools() -> List[Dict[str, Any]]:
+    global _tools_cache, _tools_dirty
+    if _tools_dirty or _tools_cache is None:
+        _tools_cache = await bridge.get_all_tools()
+        _tools_dirty = False
+    return _tools_cache
+
+# Per-server "tools discovered" signals - start paths wait on these instead
+# of sleeping a fixed interval after launching a server
+_start_events: Dict[str, asyncio.Event] = {}
+
+async def _wait_for_tools(server_name: str, timeout: float = 10.0):
+    """Wait until the bridge reports tools for server_name (or time out)"""
+    event = _start_events.setdefault(server_name, asyncio.Event())
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out waiting for tools from {server_name}")
+
+# Pre-serialized /api/servers payload, rebuilt lazily after config or
+# status changes so the polling UI doesn't pay model_dump per request
+_servers_view: Optional[bytes] = None
+
+def _invalidate_servers_view():
+    global _servers_view
+    _servers_view = None
 
 # SSE MCP Bridge that exposes tools like your original setup
 class SSEMCPBridge:
@@ -98,7 +239,7 @@ class SSEMCPBridge:
         async def list_available_tools() -> List[Dict[str, Any]]:
             """List all available tools from connected MCP servers"""
             try:
-                return await self.bridge.get_all_tools()
+                return await _cached_tools()
             except Exception as e:
                 logger.error(f"Error listing tools: {e}")
                 return []
@@ -122,16 +263,21 @@ class SSEMCPBridge:
     async def update_tools(self):
         """Update available tools when servers change"""
         try:
-            all_tools = await self.bridge.get_all_tools()
-            
-            # Register each tool individually (like your @mcp.tool() approach)
-            for tool in all_tools:
-                tool_id = f"{tool['server']}_{tool['name']}"
-                
-                if tool_id not in self.registered_tools:
-                    await self._register_individual_tool(tool)
-                    self.registered_tools[tool_id] = tool
-                    
+            all_tools = await _cached_tools()
+
+            # Diff against the registry by tool id (precomputed by the
+            # bridge) so only additions/removals are touched, and the
+            # registry stays bounded when servers stop
+            current = {tool['id']: tool for tool in all_tools}
+            added = current.keys() - self.registered_tools.keys()
+            removed = self.registered_tools.keys() - current.keys()
+
+            for tool_id in added:
+                await self._register_individual_tool(current[tool_id])
+                self.registered_tools[tool_id] = current[tool_id]
+            for tool_id in removed:
+                del self.registered_tools[tool_id]
+
             logger.info(f"Updated SSE MCP tools: {len(self.registered_tools)} total tools available")
                     
         except Exception as e:
@@ -141,42 +287,37 @@ class SSEMCPBridge:
         """Register an individual tool as a FastMCP tool"""
         # Skip individual tool registration for now - use the base tools instead
         # The base tools (list_available_tools, execute_mcp_tool) handle everything
-        server_name = tool['server']
-        tool_name = tool['name']
-        tool_id = f"{server_name}_{tool_name}"
-        
-        logger.info(f"Tool available: {tool_id}")
+        logger.info(f"Tool available: {tool['id']}")
         # Individual tool registration disabled - using base tools instead
     
     def get_app(self) -> FastAPI:
         """Get the FastAPI app with SSE server"""
         if self.app is None:
-            self.app = FastAPI(title="MCP Bridge SSE Server")
-            
+            self.app = FastAPI(title="MCP Bridge SSE Server", default_response_class=ORJSONResponse)
+
             # Add CORS middleware
-            self.app.add_middleware(
-                CORSMiddleware,
-                allow_origins=["*"],
-                allow_credentials=True,
-                allow_methods=["*"],
-                allow_headers=["*"],
-            )
+            self.app.add_middleware(WildcardCORSMiddleware)
             
             # Create the SSE server using your original working sse_server.py
             sse_server_app = create_sse_server(self.mcp)
             
             # Mount the entire SSE server at root - this preserves your original routes
             self.app.mount("/", sse_server_app)
-            
+
+            # Surface the mounted app's runner hints on the outer app so
+            # start_external_sse_server can fold them into uvicorn.Config
+            self.app.state.uvicorn_kwargs = getattr(
+                sse_server_app.state, "uvicorn_kwargs", {}
+            )
+
         return self.app
 
 # Load configuration
 def load_config():
-    global server_configs, app_settings
+    global server_configs, app_settings, _sse_endpoint_url, _settings_cached
     try:
         if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(CONFIG_FILE.read_bytes())
                 
             if 'servers' in data:
                 for server_data in data['servers']:
@@ -185,12 +326,15 @@ def load_config():
                     server_statuses[config.name] = ServerStatus(
                         name=config.name,
                         status="stopped",
-                        last_update=time.strftime("%Y-%m-%d %H:%M:%S")
+                        last_update=_now_str()
                     )
             
             if 'settings' in data:
                 app_settings = AppSettings(**data['settings'])
-                
+                _sse_endpoint_url = f"http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}"
+                _settings_cached = orjson.dumps(app_settings.model_dump())
+
+
         logger.info(f"Loaded {len(server_configs)} server configurations")
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
@@ -201,8 +345,14 @@ def save_config():
             'servers': [config.model_dump() for config in server_configs.values()],
             'settings': app_settings.model_dump()
         }
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Write to a temp file and atomically replace so a crash mid-write
+        # can never leave a truncated servers.json behind
+        tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
         logger.info("Configuration saved")
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
@@ -210,7 +360,7 @@ def save_config():
 # External SSE MCP server management
 async def start_external_sse_server():
     """Start external SSE MCP server on configured port"""
-    global external_sse_server, sse_mcp_bridge
+    global external_sse_server, external_sse_task, sse_mcp_bridge
     
     if external_sse_server is not None:
         await stop_external_sse_server()
@@ -226,29 +376,25 @@ async def start_external_sse_server():
         # Get the FastAPI app
         sse_app = sse_mcp_bridge.get_app()
         
-        # Create server config
+        # Create server config, honoring any runner hints the app carries
+        hints = getattr(sse_app.state, "uvicorn_kwargs", {})
         config = uvicorn.Config(
             sse_app,
             host=app_settings.host,
             port=app_settings.port,
+            loop=hints.get("loop", UVICORN_LOOP),
+            http=hints.get("http", UVICORN_HTTP),
+            ws=hints.get("ws", "auto"),
             log_level="info",
             access_log=False
         )
         
         external_sse_server = uvicorn.Server(config)
-        
-        # Start in background thread
-        def run_external_server():
-            asyncio.set_event_loop(asyncio.new_event_loop())
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(external_sse_server.serve())
-        
-        external_thread = threading.Thread(target=run_external_server, daemon=True)
-        external_thread.start()
-        
-        # Wait a moment for server to start
-        await asyncio.sleep(1)
-        
+
+        # Serve on the current event loop instead of spinning up a second
+        # loop in a dedicated thread
+        external_sse_task = asyncio.create_task(external_sse_server.serve())
+
         logger.info(f"SSE MCP Server started on {app_settings.host}:{app_settings.port}")
         logger.info(f"Your application can connect to: http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}")
         
@@ -257,35 +403,62 @@ async def start_external_sse_server():
 
 async def stop_external_sse_server():
     """Stop external SSE server"""
-    global external_sse_server
-    
+    global external_sse_server, external_sse_task
+
     if external_sse_server is not None:
         try:
             external_sse_server.should_exit = True
-            await asyncio.sleep(0.5)
-            external_sse_server = None
+            if external_sse_task is not None:
+                await external_sse_task
             logger.info("External SSE server stopped")
         except Exception as e:
             logger.error(f"Error stopping external SSE server: {e}")
+        finally:
+            external_sse_server = None
+            external_sse_task = None
+
+# Update tools when servers change - requests are debounced through a single
+# updater task so bursts (auto-start, multi-server bring-up) collapse into one
+# update_tools() walk
+_sse_update_pending: Optional[asyncio.Event] = None
+_sse_updater_task = None
+
+# Set once the lifespan startup completes so main() can wait for actual
+# readiness instead of sleeping a fixed interval
+_server_ready = threading.Event()
 
-# Update tools when servers change
 async def update_sse_tools():
-    """Update SSE MCP tools when servers change"""
-    if sse_mcp_bridge:
-        try:
-            await sse_mcp_bridge.update_tools()
-            logger.info("SSE MCP tools updated")
-        except Exception as e:
-            logger.error(f"Failed to update SSE tools: {e}")
+    """Request an SSE MCP tool refresh (debounced by _sse_tools_updater)"""
+    _invalidate_tools_cache()
+    if _sse_update_pending is not None:
+        _sse_update_pending.set()
+
+async def _sse_tools_updater():
+    """Single long-running task that applies coalesced tool updates"""
+    while True:
+        await _sse_update_pending.wait()
+        # Debounce window: absorb further requests arriving in the burst
+        await asyncio.sleep(0.2)
+        _sse_update_pending.clear()
+        if sse_mcp_bridge:
+            try:
+                await sse_mcp_bridge.update_tools()
+                logger.info("SSE MCP tools updated")
+            except Exception as e:
+                logger.error(f"Failed to update SSE tools: {e}")
 
 # Lifespan manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    global _sse_update_pending, _sse_updater_task
     logger.info("Starting MCP Bridge Desktop Application...")
     load_config()
     await bridge.initialize()
     bridge.set_status_callback(update_server_status)
+
+    _sse_update_pending = asyncio.Event()
+    _sse_updater_task = asyncio.create_task(_sse_tools_updater())
     
     # Start external SSE MCP server
     await start_external_sse_server()
@@ -294,33 +467,31 @@ async def lifespan(app: FastAPI):
         for server_name in server_configs:
             try:
                 logger.info(f"Auto-starting server: {server_name}")
+                _start_events.setdefault(server_name, asyncio.Event()).clear()
                 await bridge.start_server(server_name, server_configs[server_name])
                 # Wait for tools discovery
-                await asyncio.sleep(3)
+                await _wait_for_tools(server_name)
                 await update_sse_tools()
             except Exception as e:
                 logger.error(f"Failed to auto-start {server_name}: {e}")
     
     logger.info("MCP Bridge Desktop Application started successfully")
+    _server_ready.set()
     yield
     
     # Shutdown
     logger.info("Shutting down MCP Bridge Desktop Application...")
+    if _sse_updater_task is not None:
+        _sse_updater_task.cancel()
     await stop_external_sse_server()
     await bridge.cleanup()
     save_config()
     logger.info("Shutdown complete")
 
 # Create main FastAPI app
-app = FastAPI(title="MCP Bridge Desktop", lifespan=lifespan)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app = FastAPI(title="MCP Bridge Desktop", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+app.add_middleware(WildcardCORSMiddleware)
 
 # Serve the main UI
 @app.get("/", response_class=HTMLResponse)
@@ -328,8 +499,9 @@ async def get_ui():
     try:
         html_file = APP_DIR / "templates" / "index.html"
         if html_file.exists():
-            with open(html_file, 'r', encoding='utf-8') as f:
-                return HTMLResponse(f.read())
+            # FileResponse serves via sendfile and sets ETag/Last-Modified so
+            # browsers revalidate instead of re-downloading the UI each time
+            return FileResponse(html_file, media_type="text/html")
         else:
             return HTMLResponse("""
             <h1>MCP Bridge Desktop</h1>
@@ -342,15 +514,17 @@ async def get_ui():
         return HTMLResponse(f"<h1>Error</h1><p>Failed to load UI: {e}</p>")
 
 # API Routes
-@app.get("/api/settings")
+@app.get("/api/settings", response_model=None)
 async def get_settings():
-    return app_settings.model_dump()
+    return Response(content=_settings_cached, media_type="application/json")
 
 @app.post("/api/settings")
 async def update_settings(settings: AppSettings):
-    global app_settings
+    global app_settings, _sse_endpoint_url, _settings_cached
     old_settings = app_settings.model_dump()
     app_settings = settings
+    _sse_endpoint_url = f"http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}"
+    _settings_cached = orjson.dumps(app_settings.model_dump())
     save_config()
     
     # Restart external SSE server if settings changed
@@ -364,27 +538,30 @@ async def update_settings(settings: AppSettings):
     
     return {"message": "Settings updated"}
 
-@app.get("/api/servers")
+@app.get("/api/servers", response_model=None)
 async def get_servers():
-    return {
-        "servers": [
-            {
-                "config": config.model_dump(),
-                "status": server_statuses.get(name, ServerStatus(
-                    name=name,
-                    status="stopped",
-                    last_update=time.strftime("%Y-%m-%d %H:%M:%S")
-                )).model_dump()
-            }
-            for name, config in server_configs.items()
-        ]
-    }
+    global _servers_view
+    if _servers_view is None:
+        _servers_view = orjson.dumps({
+            "servers": [
+                {
+                    "config": config.model_dump(),
+                    "status": server_statuses.get(name, ServerStatus(
+                        name=name,
+                        status="stopped",
+                        last_update=_now_str()
+                    )).model_dump()
+                }
+                for name, config in server_configs.items()
+            ]
+        })
+    return Response(content=_servers_view, media_type="application/json")
 
 @app.post("/api/servers/parse")
 async def parse_mcp_json(data: MCPServerJSON):
     try:
         # Parse the JSON
-        json_data = json.loads(data.json_content)
+        json_data = orjson.loads(data.json_content)
         
         # Handle different formats
         servers_data = None
@@ -402,26 +579,28 @@ async def parse_mcp_json(data: MCPServerJSON):
         if not servers_data:
             raise Exception("No server configurations found in JSON")
         
-        parsed_servers = []
-        for name, config in servers_data.items():
-            # Handle VS Code input variables (replace with placeholder)
-            env = config.get("env", {})
-            for key, value in env.items():
-                if isinstance(value, str) and value.startswith("${input:"):
-                    env[key] = f"<REPLACE_WITH_YOUR_{key}>"
-            
-            server_config = {
+        # Build each env with a comprehension (no mutation of the parsed dict
+        # while iterating it), swapping VS Code input variables for
+        # placeholders via a fixed-length slice compare
+        parsed_servers = [
+            {
                 "name": name,
                 "command": config.get("command", ""),
                 "args": config.get("args", []),
-                "env": env,
+                "env": {
+                    key: (f"<REPLACE_WITH_YOUR_{key}>"
+                          if isinstance(value, str) and value[:8] == "${input:"
+                          else value)
+                    for key, value in config.get("env", {}).items()
+                },
                 "cwd": config.get("cwd")
             }
-            parsed_servers.append(server_config)
+            for name, config in servers_data.items()
+        ]
         
         return {"servers": parsed_servers, "message": f"Parsed {len(parsed_servers)} server(s)"}
         
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, orjson.JSONDecodeError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
     except Exception as e:
         logger.error(f"Parse error: {e}")
@@ -436,8 +615,9 @@ async def add_server(config: MCPServerConfig):
     server_statuses[config.name] = ServerStatus(
         name=config.name,
         status="stopped",
-        last_update=time.strftime("%Y-%m-%d %H:%M:%S")
+        last_update=_now_str()
     )
+    _invalidate_servers_view()
     save_config()
     return {"message": "Server added successfully"}
 
@@ -458,8 +638,9 @@ async def update_server(server_name: str, config: MCPServerConfig):
     server_statuses[config.name] = ServerStatus(
         name=config.name,
         status="stopped",
-        last_update=time.strftime("%Y-%m-%d %H:%M:%S")
+        last_update=_now_str()
     )
+    _invalidate_servers_view()
     save_config()
     return {"message": "Server updated successfully"}
 
@@ -473,9 +654,10 @@ async def start_server(server_name: str, background_tasks: BackgroundTasks):
     async def start_and_update():
         try:
             logger.info(f"Starting server: {server_name}")
+            _start_events.setdefault(server_name, asyncio.Event()).clear()
             await bridge.start_server(server_name, config)
             # Wait for tools to be discovered
-            await asyncio.sleep(3)
+            await _wait_for_tools(server_name)
             # Update SSE tools
             await update_sse_tools()
             logger.info(f"Server {server_name} started and tools updated")
@@ -494,11 +676,13 @@ async def stop_server(server_name: str):
     await bridge.stop_server(server_name)
     server_statuses[server_name].status = "stopped"
     server_statuses[server_name].pid = None
-    server_statuses[server_name].last_update = time.strftime("%Y-%m-%d %H:%M:%S")
-    
+    server_statuses[server_name].last_update = _now_str()
+    _running_servers.discard(server_name)
+    _invalidate_servers_view()
+
     # Update SSE tools
     await update_sse_tools()
-    
+
     return {"message": f"Server {server_name} stopped"}
 
 @app.delete("/api/servers/{server_name}")
@@ -511,7 +695,9 @@ async def delete_server(server_name: str):
     del server_configs[server_name]
     if server_name in server_statuses:
         del server_statuses[server_name]
-    
+
+    _running_servers.discard(server_name)
+    _invalidate_servers_view()
     save_config()
     
     # Update SSE tools
@@ -519,57 +705,61 @@ async def delete_server(server_name: str):
     
     return {"message": f"Server {server_name} deleted"}
 
-@app.get("/api/tools")
+@app.get("/api/tools", response_model=None)
 async def get_all_tools():
     try:
-        all_tools = await bridge.get_all_tools()
-        return {"tools": all_tools}
+        all_tools = await _cached_tools()
+        return ORJSONResponse({"tools": all_tools})
     except Exception as e:
         logger.error(f"Error getting tools: {e}")
-        return {"tools": []}
+        return ORJSONResponse({"tools": []})
 
 @app.post("/api/tools/execute")
-async def execute_tool(tool_data: Dict[str, Any]):
-    tool_name = tool_data.get("name")
-    server_name = tool_data.get("server")
-    arguments = tool_data.get("arguments", {})
-    
-    if not tool_name or not server_name:
-        raise HTTPException(status_code=400, detail="Tool name and server name required")
-    
+async def execute_tool(req: ExecuteToolRequest):
     try:
-        result = await bridge.execute_tool(server_name, tool_name, arguments)
+        result = await bridge.execute_tool(req.server, req.name, req.arguments)
         return {"result": result}
     except Exception as e:
         logger.error(f"Tool execution error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/status")
+@app.get("/api/status", response_model=None)
 async def get_status():
     """Get overall system status"""
-    running_servers = [name for name, status in server_statuses.items() if status.status == "running"]
-    total_tools = len(await bridge.get_all_tools()) if bridge else 0
-    
-    return {
+    total_tools = len(await _cached_tools()) if bridge else 0
+
+    return ORJSONResponse({
         "management_server": "running",
         "sse_server": "running" if external_sse_server else "stopped",
-        "sse_endpoint": f"http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}",
-        "running_servers": running_servers,
+        "sse_endpoint": _sse_endpoint_url,
+        "running_servers": list(_running_servers),
         "total_servers": len(server_configs),
         "total_tools": total_tools,
         "settings": app_settings.model_dump()
-    }
+    })
 
 # Status update callback
 def update_server_status(server_name: str, status: str, pid: Optional[int] = None, 
                         tools: List[Dict[str, Any]] = None, error: Optional[str] = None):
+    _invalidate_tools_cache()
+    _invalidate_servers_view()
+    if status == "running":
+        _running_servers.add(server_name)
+    else:
+        _running_servers.discard(server_name)
     if server_name in server_statuses:
         server_statuses[server_name].status = status
         server_statuses[server_name].pid = pid
         server_statuses[server_name].tools = tools or []
-        server_statuses[server_name].last_update = time.strftime("%Y-%m-%d %H:%M:%S")
+        server_statuses[server_name].last_update = _now_str()
         server_statuses[server_name].error_message = error
         
+        # Unblock start waiters as soon as the outcome is known - a failed
+        # start (or a server that reports no tools) counts as an outcome,
+        # otherwise _wait_for_tools would sit out its full timeout
+        if status in ("running", "error"):
+            _start_events.setdefault(server_name, asyncio.Event()).set()
+
         # Update SSE tools when status changes
         if status == "running" and tools:
             asyncio.create_task(update_sse_tools())
@@ -578,10 +768,22 @@ def update_server_status(server_name: str, status: str, pid: Optional[int] = Non
 def run_server():
     """Run the main FastAPI server"""
     try:
+        workers = int(os.environ.get("MCP_BRIDGE_WORKERS", "1"))
+        if workers > 1:
+            # Multi-worker mode cannot work from this daemon thread:
+            # uvicorn's worker supervisor installs signal handlers, which is
+            # only legal on the main thread, and every worker would run the
+            # lifespan independently — duplicating the auto-started MCP
+            # subprocesses and racing to bind the external SSE port.
+            logger.warning(
+                "MCP_BRIDGE_WORKERS=%d is not supported; running 1 worker", workers
+            )
         uvicorn.run(
             app,
             host="127.0.0.1",
             port=8765,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             log_level="info",
             access_log=False
         )
@@ -590,6 +792,12 @@ def run_server():
 
 def main():
     """Main entry point for desktop application"""
+    if sys.platform == "win32":
+        # The bridge drives MCP servers over asyncio subprocess pipes, which
+        # need the proactor loop on Windows - the default on modern Python,
+        # but be explicit since everything depends on it
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
     print("Starting MCP Bridge Desktop Application...")
     print(f"Management UI will be available at: http://127.0.0.1:8765")
     print(f"SSE MCP Server will be available at: http://{app_settings.host}:{app_settings.port}{app_settings.sse_path}")
@@ -597,9 +805,10 @@ def main():
     
     server_thread = threading.Thread(target=run_server, daemon=True)
     server_thread.start()
-    
+
     # Wait for server to start
-    time.sleep(3)
+    if not _server_ready.wait(timeout=10):
+        print("Warning: server did not report ready within 10s, continuing anyway")
     
     if len(sys.argv) > 1 and sys.argv[1] == "--electron":
         # Running from Electron
@@ -1,211 +1,244 @@
 # mcp_bridge.py - Windows-compatible version
 import asyncio
-import subprocess
+import itertools
 import json
 import logging
 import os
 import sys
-import threading
-import queue
 from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import shutil
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes straight to bytes and parses without a text decode pass;
+# fall back to stdlib json so the dependency stays optional
+try:
+    import orjson
+
+    def _json_dumps_line(obj) -> bytes:
+        # The newline is appended inside the C encoder, so framing a message
+        # costs no Python-level bytes concatenation
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _json_dumps_line(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+    _json_loads = json.loads
+
+# Connection-setup frames are constant apart from the request id; pre-encode
+# them once so bring-up skips dict construction and JSON encoding entirely
+_INIT_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"initialize","params":'
+    b'{"protocolVersion":"0.1.0","capabilities":{"tools":{}},'
+    b'"clientInfo":{"name":"MCP-Bridge","version":"1.0.0"}}}\n'
+)
+_INITIALIZED_FRAME = b'{"jsonrpc":"2.0","method":"notifications/initialized"}\n'
+_LIST_TOOLS_TEMPLATE = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list"}\n'
+
 @dataclass
 class MCPServerProcess:
     name: str
-    process: subprocess.Popen
+    process: asyncio.subprocess.Process
     tools: List[Dict[str, Any]]
     initialized: bool = False
-    stdin_queue: queue.Queue = None
-    stdout_queue: queue.Queue = None
-    stderr_queue: queue.Queue = None
+    # Tools pre-decorated with server/id, built once at discovery time so
+    # get_all_tools doesn't copy every tool dict per call
+    exposed_tools: List[Dict[str, Any]] = field(default_factory=list)
+    # Tool-name index for O(1) execute_tool validation
+    tool_names: frozenset = frozenset()
+    # Outbound frames awaiting the stdin writer task; queued frames are
+    # drained together so bursts still share one writelines + drain
+    stdin_queue: Optional[asyncio.Queue] = None
+    # Per-server tasks, held so stop_server can cancel them instead of
+    # leaving coroutines spinning against closed pipes
+    stdout_task: Optional[asyncio.Task] = None
+    stderr_task: Optional[asyncio.Task] = None
+    writer_task: Optional[asyncio.Task] = None
 
 class MCPBridge:
     """Windows-compatible bridge between stdio MCP servers and SSE-compatible interface"""
-    
+
     def __init__(self):
         self.servers: Dict[str, MCPServerProcess] = {}
-        self.request_id_counter = 0
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        self._next_id = itertools.count(1).__next__
+        self.pending_requests: Dict[int, asyncio.Future] = {}
         self.status_callback: Optional[Callable] = None
-        
+        # Executable lookups stat every PATH entry; resolve each command once
+        self._which_cache: Dict[str, str] = {}
+        # Probe the Windows node install dirs once instead of per server start
+        self._win_path_prefix = ""
+        if sys.platform == "win32":
+            node_paths = [p for p in (
+                r"C:\Program Files\nodejs",
+                r"C:\Program Files (x86)\nodejs",
+                os.path.expanduser(r"~\AppData\Roaming\npm"),
+            ) if os.path.exists(p)]
+            self._win_path_prefix = ";".join(node_paths)
+        # Copy the process environment once (it can run to 100+ entries);
+        # start_server just merges per-config overrides into this template
+        self._base_env = os.environ.copy()
+        if self._win_path_prefix:
+            current_path = self._base_env.get('PATH', '')
+            if self._win_path_prefix not in current_path:
+                self._base_env['PATH'] = f"{self._win_path_prefix};{current_path}"
+
     async def initialize(self):
         """Initialize the bridge system"""
         logger.info("MCP Bridge initialized")
-        
+
     def set_status_callback(self, callback: Callable):
         """Set callback for status updates"""
         self.status_callback = callback
-        
+
     def _notify_status(self, server_name: str, status: str, **kwargs):
         """Notify status change"""
         if self.status_callback:
             self.status_callback(server_name, status, **kwargs)
-    
+
+    def _enlarge_pipe_buffers(self, process):
+        """Grow stdio pipe capacity on Linux (default 64 KiB) so servers that
+        emit large tool-list payloads don't block mid-write"""
+        if not sys.platform.startswith("linux"):
+            return
+        try:
+            import fcntl
+            f_setpipe_sz = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+            # The pipe objects hang off the subprocess transport; best-effort
+            # only, since this touches loop internals
+            for fd_index in (0, 1, 2):
+                transport = process._transport.get_pipe_transport(fd_index)
+                pipe = transport.get_extra_info("pipe") if transport else None
+                if pipe is not None:
+                    fcntl.fcntl(pipe.fileno(), f_setpipe_sz, 1 << 20)
+        except (OSError, AttributeError, ValueError) as e:
+            logger.debug(f"Could not enlarge pipe buffers: {e}")
+
     def _find_executable(self, command: str) -> str:
-        """Find the full path to an executable"""
+        """Find the full path to an executable (memoized)"""
+        cached = self._which_cache.get(command)
+        if cached is None:
+            cached = self._which_cache[command] = self._resolve_executable(command)
+        return cached
+
+    def _resolve_executable(self, command: str) -> str:
+        """Resolve a command to a full path by probing PATH"""
         if os.path.isabs(command) and os.path.exists(command):
             return command
-            
+
         found = shutil.which(command)
         if found:
             return found
-            
+
         if sys.platform == "win32":
             for ext in ['.cmd', '.exe', '.bat']:
                 cmd_with_ext = command + ext
                 found = shutil.which(cmd_with_ext)
                 if found:
                     return found
-                    
-        return command
-
-    def _stdin_writer_thread(self, process, stdin_queue):
-        """Thread to handle stdin writing"""
-        try:
-            while True:
-                try:
-                    data = stdin_queue.get(timeout=1.0)
-                    if data is None:  # Shutdown signal
-                        break
-                    process.stdin.write(data)
-                    process.stdin.flush()
-                    stdin_queue.task_done()
-                except queue.Empty:
-                    if process.poll() is not None:
-                        break
-                except Exception as e:
-                    logger.error(f"Stdin writer error: {e}")
-                    break
-        except Exception as e:
-            logger.error(f"Stdin thread error: {e}")
 
-    def _stdout_reader_thread(self, process, stdout_queue):
-        """Thread to handle stdout reading"""
-        try:
-            while True:
-                line = process.stdout.readline()
-                if not line:
-                    break
-                stdout_queue.put(line.strip())
-        except Exception as e:
-            logger.error(f"Stdout reader error: {e}")
+        return command
 
-    def _stderr_reader_thread(self, process, stderr_queue):
-        """Thread to handle stderr reading"""
-        try:
-            while True:
-                line = process.stderr.readline()
-                if not line:
-                    break
-                stderr_queue.put(line.strip())
-        except Exception as e:
-            logger.error(f"Stderr reader error: {e}")
-    
     async def start_server(self, server_name: str, config):
-        """Start an MCP server process with Windows-compatible threading"""
+        """Start an MCP server process on asyncio subprocess pipes"""
         if server_name in self.servers:
             logger.warning(f"Server {server_name} already running")
             return
-            
+
         try:
             command = self._find_executable(config.command)
             logger.info(f"Using command: {command}")
-            
-            # Prepare environment
-            env = os.environ.copy()
-            if config.env:
-                env.update(config.env)
-            
-            # Windows PATH handling
-            if sys.platform == "win32":
-                node_paths = [
-                    r"C:\Program Files\nodejs",
-                    r"C:\Program Files (x86)\nodejs",
-                    os.path.expanduser(r"~\AppData\Roaming\npm"),
-                ]
-                current_path = env.get('PATH', '')
-                for node_path in node_paths:
-                    if os.path.exists(node_path) and node_path not in current_path:
-                        env['PATH'] = f"{node_path};{current_path}"
-            
-            cmd_args = [command] + config.args
-            logger.info(f"Starting process: {' '.join(cmd_args)}")
-            
-            # Start process with threading approach
-            process = subprocess.Popen(
-                cmd_args,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+
+            # Prepare environment from the precomputed template (PATH
+            # augmentation already applied in __init__)
+            env = {**self._base_env, **(config.env or {})}
+
+            logger.info(f"Starting process: {command} {' '.join(config.args)}")
+
+            # Spawn on the event loop - readable pipes wake the loop directly,
+            # no reader/writer threads or polling queues needed
+            process = await asyncio.create_subprocess_exec(
+                command,
+                *config.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 env=env,
                 cwd=config.cwd,
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True
+                limit=1 << 20
+            )
+
+            self._enlarge_pipe_buffers(process)
+
+            # Probe for an immediate failure without a fixed stall: wait for
+            # either process exit or first output, giving up the probe after
+            # 0.5 s at most (healthy servers that talk early return sooner)
+            wait_task = asyncio.create_task(process.wait())
+            probe_task = asyncio.create_task(process.stdout.readline())
+            done, _ = await asyncio.wait(
+                {wait_task, probe_task},
+                timeout=0.5,
+                return_when=asyncio.FIRST_COMPLETED
             )
-            
-            # Wait to see if process starts
-            await asyncio.sleep(0.5)
-            
-            if process.poll() is not None:
-                stdout, stderr = process.communicate()
-                error_msg = f"Process failed to start. Return code: {process.returncode}\nStdout: {stdout}\nStderr: {stderr}"
+
+            # An immediate exit usually shows up as stdout EOF first (the
+            # pipe closes before the child watcher reaps the exit), so an
+            # empty probe line means death just as surely as wait_task
+            first_line = probe_task.result() if probe_task in done else None
+            if wait_task in done or process.returncode is not None or first_line == b"":
+                probe_task.cancel()
+                wait_task.cancel()
+                # Let the watcher reap so the return code is real, and don't
+                # hang on stderr if the process is somehow still alive
+                try:
+                    await asyncio.wait_for(process.wait(), 1.0)
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    stderr = await asyncio.wait_for(process.stderr.read(), 1.0)
+                except asyncio.TimeoutError:
+                    stderr = b""
+                error_msg = (
+                    f"Process failed to start. Return code: {process.returncode}\n"
+                    f"Stderr: {stderr.decode(errors='replace')}"
+                )
                 logger.error(error_msg)
                 self._notify_status(server_name, "error", error=error_msg)
                 return
-            
-            # Create queues for communication
-            stdin_queue = queue.Queue()
-            stdout_queue = queue.Queue()
-            stderr_queue = queue.Queue()
-            
-            # Start communication threads
-            stdin_thread = threading.Thread(
-                target=self._stdin_writer_thread, 
-                args=(process, stdin_queue),
-                daemon=True
-            )
-            stdout_thread = threading.Thread(
-                target=self._stdout_reader_thread, 
-                args=(process, stdout_queue),
-                daemon=True
-            )
-            stderr_thread = threading.Thread(
-                target=self._stderr_reader_thread, 
-                args=(process, stderr_queue),
-                daemon=True
-            )
-            
-            stdin_thread.start()
-            stdout_thread.start()
-            stderr_thread.start()
-            
+
+            wait_task.cancel()
+            # Any line the probe consumed is fed back through the dispatcher
+            if first_line is None:
+                probe_task.cancel()
+
             server_process = MCPServerProcess(
                 name=server_name,
                 process=process,
                 tools=[],
-                stdin_queue=stdin_queue,
-                stdout_queue=stdout_queue,
-                stderr_queue=stderr_queue
+                stdin_queue=asyncio.Queue(maxsize=4096)
             )
-            
+
             self.servers[server_name] = server_process
-            
+
             # Start background tasks
-            asyncio.create_task(self._handle_server_output(server_name))
-            asyncio.create_task(self._handle_server_errors(server_name))
-            
+            server_process.stdout_task = asyncio.create_task(
+                self._handle_server_output(server_name, first_line))
+            server_process.stderr_task = asyncio.create_task(
+                self._handle_server_errors(server_name))
+            server_process.writer_task = asyncio.create_task(
+                self._stdin_writer(server_process))
+
             # Initialize MCP connection
             await self._initialize_mcp_server(server_name)
-            
+
             self._notify_status(server_name, "running", pid=process.pid)
             logger.info(f"Started MCP server: {server_name}")
-            
+
         except Exception as e:
             error_msg = f"Failed to start server {server_name}: {e}"
             logger.error(error_msg)
@@ -213,252 +246,307 @@ class MCPBridge:
             if server_name in self.servers:
                 del self.servers[server_name]
             raise Exception(error_msg)
-    
+
     async def _initialize_mcp_server(self, server_name: str):
         """Initialize MCP protocol with server"""
         server = self.servers[server_name]
-        
+
         try:
             # Send initialize request
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": self._get_request_id(),
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "0.1.0",
-                    "capabilities": {"tools": {}},
-                    "clientInfo": {"name": "MCP-Bridge", "version": "1.0.0"}
-                }
-            }
-            
-            response = await self._send_request(server_name, init_request)
+            request_id = self._get_request_id()
+            response = await self._send_raw_request(
+                server_name, request_id, _INIT_TEMPLATE % request_id
+            )
             if response.get("error"):
                 raise Exception(f"MCP initialization failed: {response['error']}")
-            
+
             # Send initialized notification
-            initialized_notification = {
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized"
-            }
-            
-            await self._send_notification(server_name, initialized_notification)
-            
+            await self._queue_write(server, _INITIALIZED_FRAME)
+
             # List available tools
             await self._list_tools(server_name)
-            
+
             server.initialized = True
             logger.info(f"MCP server {server_name} initialized successfully")
-            
+
         except Exception as e:
             error_msg = f"Failed to initialize MCP server {server_name}: {e}"
             logger.error(error_msg)
             self._notify_status(server_name, "error", error=error_msg)
-    
+
     async def _list_tools(self, server_name: str):
         """List tools available from MCP server"""
         try:
-            list_tools_request = {
-                "jsonrpc": "2.0",
-                "id": self._get_request_id(),
-                "method": "tools/list"
-            }
-            
-            response = await self._send_request(server_name, list_tools_request)
+            request_id = self._get_request_id()
+            response = await self._send_raw_request(
+                server_name, request_id, _LIST_TOOLS_TEMPLATE % request_id
+            )
             if response.get("result") and "tools" in response["result"]:
-                self.servers[server_name].tools = response["result"]["tools"]
+                server = self.servers[server_name]
+                server.tools = response["result"]["tools"]
+                server.exposed_tools = [
+                    {**tool, "server": server_name, "id": f"{server_name}_{tool['name']}"}
+                    for tool in server.tools
+                ]
+                server.tool_names = frozenset(tool["name"] for tool in server.tools)
                 self._notify_status(
-                    server_name, 
-                    "running", 
+                    server_name,
+                    "running",
                     tools=response["result"]["tools"]
                 )
                 logger.info(f"Found {len(response['result']['tools'])} tools for {server_name}")
             else:
                 logger.warning(f"No tools found for {server_name}")
-                
+
         except Exception as e:
             logger.error(f"Failed to list tools for {server_name}: {e}")
-    
+
     async def _send_request(self, server_name: str, request: Dict[str, Any]) -> Dict[str, Any]:
         """Send a JSON-RPC request and wait for response"""
+        return await self._send_raw_request(
+            server_name, request["id"], _json_dumps_line(request)
+        )
+
+    async def _send_raw_request(self, server_name: str, request_id: int, payload: bytes) -> Dict[str, Any]:
+        """Send a pre-encoded JSON-RPC frame and wait for its response"""
         if server_name not in self.servers:
             raise Exception(f"Server {server_name} not found")
-        
+
         server = self.servers[server_name]
-        request_id = str(request["id"])
-        
+
         # Create future for response
         future = asyncio.Future()
         self.pending_requests[request_id] = future
-        
+
         try:
-            # Send request via queue
-            request_json = json.dumps(request) + "\n"
-            server.stdin_queue.put(request_json)
-            
-            # Wait for response
+            # Stage the frame; frames queued in the same tick share one flush
+            await self._queue_write(server, payload)
+
+            # Wait for response - the dispatcher pops the entry when it
+            # resolves the future, so only failure paths clean up here
             response = await asyncio.wait_for(future, timeout=30.0)
             return response
-            
+
         except asyncio.TimeoutError:
+            self.pending_requests.pop(request_id, None)
             raise Exception(f"Request timeout for {server_name}")
         except Exception as e:
+            self.pending_requests.pop(request_id, None)
             raise Exception(f"Failed to send request to {server_name}: {e}")
-        finally:
-            if request_id in self.pending_requests:
-                del self.pending_requests[request_id]
-    
+
     async def _send_notification(self, server_name: str, notification: Dict[str, Any]):
         """Send a JSON-RPC notification"""
         if server_name not in self.servers:
             raise Exception(f"Server {server_name} not found")
-        
+
         server = self.servers[server_name]
         try:
-            notification_json = json.dumps(notification) + "\n"
-            server.stdin_queue.put(notification_json)
+            payload = _json_dumps_line(notification)
+            await self._queue_write(server, payload)
         except Exception as e:
             logger.error(f"Failed to send notification to {server_name}: {e}")
-    
-    async def _handle_server_output(self, server_name: str):
+
+    async def _queue_write(self, server: MCPServerProcess, payload: bytes):
+        """Hand an outbound frame to the server's stdin writer task.
+
+        The queue is bounded, so a server that stops draining stdin pushes
+        back on callers here instead of growing the queue until OOM.
+        """
+        await server.stdin_queue.put(payload)
+
+    async def _stdin_writer(self, server: MCPServerProcess):
+        """Drain the stdin queue, batching whatever is queued per wakeup"""
+        stdin_queue = server.stdin_queue
+        try:
+            while True:
+                data = await stdin_queue.get()
+                if data is None:  # Shutdown signal
+                    break
+                batch = [data]
+                shutdown = False
+                # Greedily drain the queue so a burst of frames still goes
+                # out as one writelines + drain
+                while True:
+                    try:
+                        extra = stdin_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if extra is None:
+                        shutdown = True
+                        break
+                    batch.append(extra)
+                server.process.stdin.writelines(batch)
+                await server.process.stdin.drain()
+                if shutdown:
+                    break
+        except Exception as e:
+            logger.error(f"Stdin writer error for {server.name}: {e}")
+
+    async def _handle_server_output(self, server_name: str, first_line: Optional[bytes] = None):
         """Handle stdout from MCP server"""
         server = self.servers[server_name]
-        
+
         try:
-            while True:
+            if first_line:
+                first_line = first_line.strip(b"\r\n")
+                if first_line:
+                    try:
+                        self._handle_server_message(server_name, _json_loads(first_line))
+                    except ValueError:
+                        logger.debug(f"Non-JSON output from {server_name}: {first_line}")
+            async for line in server.process.stdout:
+                # Keep the frame as bytes - both JSON parsers eat bytes
+                # directly, so there is no reason to decode per line
+                line = line.strip(b"\r\n")
+                if not line:
+                    continue
                 try:
-                    # Check for stdout messages
-                    line = server.stdout_queue.get_nowait()
-                    if line:
-                        try:
-                            message = json.loads(line)
-                            await self._handle_server_message(server_name, message)
-                        except json.JSONDecodeError:
-                            logger.debug(f"Non-JSON output from {server_name}: {line}")
-                except queue.Empty:
-                    # No messages, check if process is still running
-                    if server.process.poll() is not None:
-                        break
-                    await asyncio.sleep(0.1)
-                    
+                    message = _json_loads(line)
+                    self._handle_server_message(server_name, message)
+                except ValueError:
+                    logger.debug(f"Non-JSON output from {server_name}: {line}")
+
         except Exception as e:
             logger.error(f"Error handling output from {server_name}: {e}")
             self._notify_status(server_name, "error", error=str(e))
-    
+
     async def _handle_server_errors(self, server_name: str):
         """Handle stderr from MCP server"""
         server = self.servers[server_name]
-        
+
         try:
+            # stderr can be a firehose from a misbehaving server; read it in
+            # 64 KiB chunks and split lines ourselves so a burst costs one
+            # wakeup per chunk instead of one per line
+            buf = b""
             while True:
-                try:
-                    line = server.stderr_queue.get_nowait()
+                chunk = await server.process.stderr.read(65536)
+                if not chunk:
+                    break
+                buf += chunk
+                *complete, buf = buf.split(b"\n")
+                for line in complete:
+                    line = line.decode(errors='replace').strip()
                     if line:
                         logger.warning(f"MCP server {server_name} stderr: {line}")
-                except queue.Empty:
-                    if server.process.poll() is not None:
-                        break
-                    await asyncio.sleep(0.1)
-                    
+            tail = buf.decode(errors='replace').strip()
+            if tail:
+                logger.warning(f"MCP server {server_name} stderr: {tail}")
+
         except Exception as e:
             logger.error(f"Error handling stderr from {server_name}: {e}")
-    
-    async def _handle_server_message(self, server_name: str, message: Dict[str, Any]):
+
+    def _handle_server_message(self, server_name: str, message: Dict[str, Any]):
         """Handle a message from MCP server"""
-        if "id" in message and str(message["id"]) in self.pending_requests:
-            request_id = str(message["id"])
-            future = self.pending_requests[request_id]
-            if not future.done():
-                future.set_result(message)
-        else:
-            logger.debug(f"Received message from {server_name}: {message}")
-    
+        # Hot shape first: a response carrying a pending id resolves with a
+        # single dict probe; notifications/broadcasts fall through
+        msg_id = message.get("id")
+        if msg_id is not None:
+            # Ids are ints end-to-end; coerce once in case a server echoes
+            # them back as strings
+            if isinstance(msg_id, str) and msg_id.isdigit():
+                msg_id = int(msg_id)
+            future = self.pending_requests.pop(msg_id, None)
+            if future is not None:
+                if not future.cancelled():
+                    future.set_result(message)
+                return
+        logger.debug("Unmatched message from %s: %s", server_name, message)
+
     def _get_request_id(self) -> int:
         """Get next request ID"""
-        self.request_id_counter += 1
-        return self.request_id_counter
-    
+        return self._next_id()
+
     async def stop_server(self, server_name: str):
         """Stop an MCP server"""
         if server_name not in self.servers:
             return
-        
+
         server = self.servers[server_name]
-        
+
         try:
-            # Signal shutdown to stdin thread
-            server.stdin_queue.put(None)
-            
-            # Terminate process
-            server.process.terminate()
-            
-            # Wait for termination
+            # Signal shutdown to the stdin writer task; if the queue is
+            # jammed full, the task gets cancelled below anyway
             try:
-                await asyncio.wait_for(
-                    self._wait_for_process(server.process), 
-                    timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                server.process.kill()
-                await self._wait_for_process(server.process)
-            
+                server.stdin_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+            # Terminate process - unlike Popen.terminate(), the asyncio
+            # variant raises ProcessLookupError once the child has been
+            # reaped, so skip it for servers that already died
+            if server.process.returncode is None:
+                try:
+                    server.process.terminate()
+                except ProcessLookupError:
+                    pass
+
+                # Wait for termination
+                try:
+                    await asyncio.wait_for(server.process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    server.process.kill()
+                    await server.process.wait()
+
         except Exception as e:
             logger.error(f"Error stopping server {server_name}: {e}")
         finally:
+            # Reap the per-server tasks so nothing outlives the process
+            tasks = [t for t in (server.stdout_task, server.stderr_task, server.writer_task)
+                     if t is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             del self.servers[server_name]
             self._notify_status(server_name, "stopped")
-        
+
         logger.info(f"Stopped MCP server: {server_name}")
-    
-    async def _wait_for_process(self, process):
-        """Wait for process to terminate"""
-        while process.poll() is None:
-            await asyncio.sleep(0.1)
-    
+
     async def get_server_tools(self, server_name: str) -> List[Dict[str, Any]]:
         """Get tools from a specific server"""
         if server_name not in self.servers:
             return []
         return self.servers[server_name].tools
-    
+
     async def get_all_tools(self) -> List[Dict[str, Any]]:
         """Get all tools from all running servers"""
-        all_tools = []
-        for server_name, server in self.servers.items():
-            if server.initialized:
-                for tool in server.tools:
-                    tool_with_server = tool.copy()
-                    tool_with_server["server"] = server_name
-                    all_tools.append(tool_with_server)
-        return all_tools
-    
+        return list(itertools.chain.from_iterable(
+            server.exposed_tools
+            for server in self.servers.values()
+            if server.initialized
+        ))
+
     async def execute_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Execute a tool on a specific server"""
         if server_name not in self.servers:
             raise Exception(f"Server {server_name} not found")
-        
+
         server = self.servers[server_name]
         if not server.initialized:
             raise Exception(f"Server {server_name} not initialized")
-        
-        tool_exists = any(tool["name"] == tool_name for tool in server.tools)
-        if not tool_exists:
+
+        if tool_name not in server.tool_names:
             raise Exception(f"Tool {tool_name} not found on server {server_name}")
-        
+
         execute_request = {
             "jsonrpc": "2.0",
             "id": self._get_request_id(),
             "method": "tools/call",
             "params": {"name": tool_name, "arguments": arguments}
         }
-        
+
         response = await self._send_request(server_name, execute_request)
-        
+
         if response.get("error"):
             raise Exception(f"Tool execution failed: {response['error']}")
-        
+
         return response.get("result")
-    
+
     async def cleanup(self):
         """Cleanup all servers on shutdown"""
-        for server_name in list(self.servers.keys()):
-            await self.stop_server(server_name)
\ No newline at end of file
+        # Stop concurrently so shutdown costs the slowest server's timeout,
+        # not the sum of all of them
+        await asyncio.gather(
+            *(self.stop_server(server_name) for server_name in list(self.servers.keys())),
+            return_exceptions=True
+        )
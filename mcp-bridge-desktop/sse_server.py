@@ -1,42 +1,474 @@
+import asyncio
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import socket
+import sys
+import threading
+from types import SimpleNamespace
+
 from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
-from starlette.applications import Starlette
-from starlette.routing import Mount, Route
+from starlette.requests import Request
 from starlette.responses import Response
 
+# JSON helpers for batch framing; orjson when installed, stdlib otherwise
+try:
+    import orjson as _fastjson
+
+    def _json_loads(data):
+        return _fastjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return _fastjson.dumps(obj)
+except ImportError:
+    import json as _stdjson
+
+    def _json_loads(data):
+        return _stdjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return _stdjson.dumps(obj).encode("utf-8")
+
+# Faster SSE frame encoding: sse_starlette renders each frame through a
+# line-splitting formatter, but the overwhelmingly common frame here is a
+# single-line data payload with an optional event name, which a straight
+# bytes join handles in a fraction of the time. Frames with ids, retry
+# hints, comments, multi-line data or anything unexpected fall back to
+# the original encoder, and the patch is applied at most once.
+try:
+    from sse_starlette.sse import ServerSentEvent as _SSEFrame
+
+    if not getattr(_SSEFrame, "_fast_encode_patched", False):
+        _orig_encode = _SSEFrame.encode
+        _DATA_PREFIX = b"data: "
+        _EVENT_PREFIX = b"event: "
+        _LF = b"\n"
+        _FRAME_END = b"\n\n"
+
+        def _fast_encode(self):
+            try:
+                if (
+                    getattr(self, "id", None) is not None
+                    or getattr(self, "retry", None) is not None
+                    or getattr(self, "comment", None) is not None
+                ):
+                    return _orig_encode(self)
+                data = self.data
+                if isinstance(data, str):
+                    data = data.encode("utf-8")
+                elif not isinstance(data, bytes):
+                    return _orig_encode(self)
+                if b"\n" in data or b"\r" in data:
+                    return _orig_encode(self)
+                event = getattr(self, "event", None)
+                if event:
+                    if isinstance(event, str):
+                        event = event.encode("utf-8")
+                    return b"".join(
+                        (_EVENT_PREFIX, event, _LF, _DATA_PREFIX, data, _FRAME_END)
+                    )
+                return b"".join((_DATA_PREFIX, data, _FRAME_END))
+            except Exception:
+                return _orig_encode(self)
+
+        _SSEFrame.encode = _fast_encode
+        _SSEFrame._fast_encode_patched = True
+except ImportError:
+    pass
+
+# Server-runner hints, detected once at import: prefer the uvloop event loop
+# and httptools parser when installed, and skip the websocket protocol this
+# app never speaks. The host process folds these into its uvicorn.Config.
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "asyncio"
+
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "h11"
+
+# Swap the SSE transport's JSON codec for orjson where both are available.
+# The shim is injected into the transport module's own namespace (never the
+# stdlib json module) and only when that module actually binds a `json`
+# attribute — transports that serialize through pydantic are left alone.
+try:
+    import orjson
+
+    import mcp.server.sse as _sse_module
+
+    class _OrjsonShim:
+        """json-module lookalike backed by orjson"""
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        @staticmethod
+        def loads(data):
+            return orjson.loads(data)
+
+    if hasattr(_sse_module, "json"):
+        _sse_module.json = _OrjsonShim()
+except ImportError:
+    pass
+
+# Queue-backed logger: records are handed to a SimpleQueue and written to
+# stderr by a listener thread, keeping formatting and I/O off the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stderr)
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+# The host app routes the root logger through its own queue; without this,
+# every record here would be emitted twice (and copied to the log file)
+logger.propagate = False
+
+# Transports are cached per endpoint path so repeated create_sse_server
+# calls (e.g. app restarts within one process) reuse the same instance and
+# its session table instead of constructing a fresh one each time
+_TRANSPORT_CACHE: dict = {}
+_transport_cache_lock = threading.Lock()
+
+def _get_transport(endpoint: str) -> SseServerTransport:
+    with _transport_cache_lock:
+        transport = _TRANSPORT_CACHE.get(endpoint)
+        if transport is None:
+            transport = _TRANSPORT_CACHE.setdefault(endpoint, SseServerTransport(endpoint))
+        return transport
+
+# Canned 404 for unknown paths; it never reaches a router. The start
+# message is built per request because middleware (WildcardCORSMiddleware
+# in main.py) appends headers to start messages in place — sharing one
+# dict would accumulate every caller's CORS headers. The body message
+# carries nothing mutable and stays shared.
+_NOT_FOUND_HEADERS = [
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"9"),
+]
+_NOT_FOUND_BODY = {"type": "http.response.body", "body": b"Not Found"}
+
+def _not_found_start():
+    return {
+        "type": "http.response.start",
+        "status": 404,
+        "headers": list(_NOT_FOUND_HEADERS),
+    }
+
+def _replay_body(body: bytes):
+    """Build an ASGI receive callable that replays an already-read body"""
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            return {"type": "http.disconnect"}
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return receive
+
+def _tune_socket(scope, send):
+    """Disable Nagle (and delayed ACKs where supported) on an SSE socket
+
+    Small event frames should leave immediately instead of waiting to be
+    batched by the kernel. uvicorn does not expose the transport in the
+    ASGI scope, but its send callable is a bound method of the protocol
+    cycle, which does carry the transport — reach it that way first and
+    fall back to a scope["transport"] for servers that provide one.
+    Anything unreachable, and platforms without TCP_QUICKACK, are
+    tolerated silently.
+    """
+    cycle = getattr(send, "__self__", None)
+    transport = getattr(cycle, "transport", None) or scope.get("transport")
+    if transport is None or not hasattr(transport, "get_extra_info"):
+        return
+    sock = transport.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+# Fixed responses are stateless, so build them once and return the same
+# instance instead of re-rendering headers per request
+_SSE_CLOSED = Response("SSE connection closed", status_code=200)
+_SSE_ERR = Response("SSE connection error", status_code=500)
+
+# One live session per client key: a reconnect from the same client (sent as
+# the x-client-id header) evicts its stale session instead of leaving the old
+# task and its handshake state hanging until the peer times out
+_client_sessions = {}
+_client_sessions_lock = asyncio.Lock()
+# Tasks cancelled by eviction, so the evicted handler can tell a planned
+# takeover apart from an external cancellation and exit quietly
+_evicted_sessions = set()
+
+# Outbound SSE write coalescing: streamed body frames are buffered and
+# flushed on a short timer or byte threshold, so a burst of small events
+# costs one socket write instead of one per event. SSE_COALESCE_MS=0
+# disables buffering.
+_COALESCE_DELAY = int(os.environ.get("SSE_COALESCE_MS", "5")) / 1000.0
+_COALESCE_BYTES = int(os.environ.get("SSE_COALESCE_BYTES", str(16 * 1024)))
+
+# Sessions that have written nothing but keepalives for this many seconds
+# are reaped; the deadline resets on every data-bearing outbound frame, so
+# actively-streaming clients are never cut off. 0 or less disables reaping.
+_IDLE_TIMEOUT = float(os.environ.get("SSE_IDLE_TIMEOUT", "300"))
+
+def _stamp_writes(send, idle_cell, loop):
+    """Wrap send so each data-bearing write refreshes the idle stamp
+
+    SSE keepalive comments (frames starting with ':') don't count as
+    activity, otherwise the transport's periodic pings would keep a dead
+    session alive forever.
+    """
+    async def stamped(message):
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if body and not body.startswith(b":"):
+                idle_cell[0] = loop.time()
+        await send(message)
+
+    return stamped
+
+class CoalescingSend:
+    """Wrap an ASGI send callable, batching streamed response body frames"""
+
+    def __init__(self, send):
+        self._send = send
+        self._buffer = bytearray()
+        self._handle = None
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if message.get("more_body"):
+                self._buffer += body
+                if len(self._buffer) >= _COALESCE_BYTES:
+                    await self.flush()
+                elif self._handle is None:
+                    self._handle = asyncio.get_running_loop().call_later(
+                        _COALESCE_DELAY, self._timer_flush
+                    )
+                return
+            # Final frame: fold buffered bytes in and stop the timer
+            if self._buffer:
+                message = {**message, "body": bytes(self._buffer) + body}
+                self._buffer.clear()
+            self._cancel_timer()
+        await self._send(message)
+
+    def _cancel_timer(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _timer_flush(self):
+        self._handle = None
+        if self._buffer:
+            asyncio.ensure_future(self.flush())
+
+    async def flush(self):
+        """Write out everything currently buffered"""
+        self._cancel_timer()
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        await self._send({"type": "http.response.body", "body": data, "more_body": True})
+
 def create_sse_server(mcp: FastMCP):
-    """Create a Starlette app that handles SSE connections and message handling"""
-    transport = SseServerTransport("/messages/")
+    """Create an ASGI app that handles SSE connections and message handling"""
+    transport = _get_transport("/messages/")
+    # Initialization options are static per server; build them once here
+    # rather than on every SSE connection
+    init_opts = mcp._mcp_server.create_initialization_options()
 
     # Define handler functions
     async def handle_sse(request):
+        client_key = request.headers.get("x-client-id")
+        session_task = asyncio.current_task()
+        if client_key is not None:
+            async with _client_sessions_lock:
+                stale = _client_sessions.get(client_key)
+                if stale is not None and stale is not session_task:
+                    _evicted_sessions.add(stale)
+                    stale.cancel()
+                _client_sessions[client_key] = session_task
+
+        _tune_socket(request.scope, request._send)
+        # Once the SSE response has started, handle_sse must not return a
+        # Response — dispatch would send a second http.response.start on the
+        # same connection
+        started = [False]
+        inner_send = request._send
+
+        async def raw_send(message):
+            if message["type"] == "http.response.start":
+                started[0] = True
+            await inner_send(message)
+
+        idle_cell = None
+        if _IDLE_TIMEOUT > 0:
+            loop = asyncio.get_running_loop()
+            idle_cell = [loop.time()]
+            raw_send = _stamp_writes(raw_send, idle_cell, loop)
+        send = CoalescingSend(raw_send) if _COALESCE_DELAY > 0 else raw_send
+
         try:
             async with transport.connect_sse(
-                request.scope, request.receive, request._send
+                request.scope, request.receive, send
             ) as streams:
-                await mcp._mcp_server.run(
-                    streams[0], streams[1], mcp._mcp_server.create_initialization_options()
+                session = asyncio.ensure_future(
+                    mcp._mcp_server.run(streams[0], streams[1], init_opts)
                 )
-        except Exception as e:
-            print(f"SSE Error: {e}")
-            return Response("SSE connection error", status_code=500)
-        
-        return Response("SSE connection closed", status_code=200)
-
-    # Define messages handler
-    async def handle_messages(request):
-        """Handle POST messages to the MCP server"""
+                try:
+                    if idle_cell is None:
+                        await session
+                    else:
+                        # Watchdog: wake at each idle deadline; a data write
+                        # in the meantime pushes the deadline forward
+                        while True:
+                            remaining = idle_cell[0] + _IDLE_TIMEOUT - loop.time()
+                            if remaining <= 0:
+                                logger.info(
+                                    "SSE session idle for %ss, closing", _IDLE_TIMEOUT
+                                )
+                                session.cancel()
+                                try:
+                                    await session
+                                except asyncio.CancelledError:
+                                    pass
+                                # The stream is live; just close it quietly
+                                return None
+                            done, _ = await asyncio.wait({session}, timeout=remaining)
+                            if done:
+                                session.result()
+                                break
+                finally:
+                    if not session.done():
+                        session.cancel()
+        except asyncio.CancelledError:
+            # Eviction by a reconnect is the feature working as designed,
+            # not an error; anything else is a real cancellation
+            if session_task not in _evicted_sessions:
+                raise
+            logger.info("SSE session for client %s evicted by reconnect", client_key)
+            return None
+        except Exception:
+            logger.exception("SSE connection error")
+            return None if started[0] else _SSE_ERR
+        finally:
+            _evicted_sessions.discard(session_task)
+            if isinstance(send, CoalescingSend):
+                await send.flush()
+            if client_key is not None and _client_sessions.get(client_key) is session_task:
+                del _client_sessions[client_key]
+
+        return None if started[0] else _SSE_CLOSED
+
+    async def post_messages(scope, receive, send):
+        """Accept single or batched JSON-RPC messages on /messages/
+
+        The body is read exactly once. A JSON array is fanned into the
+        transport one element at a time with a capturing send, and the
+        per-element statuses are aggregated into a single JSON reply;
+        anything else replays the cached body into the normal path.
+        """
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        if body.lstrip()[:1] != b"[":
+            await transport.handle_post_message(scope, _replay_body(body), send)
+            return
+
         try:
-            return await transport.handle_post_message(request)
-        except Exception as e:
-            print(f"Message handling error: {e}")
-            return Response("Message handling error", status_code=500)
-
-    # Create Starlette routes for SSE and message handling
-    routes = [
-        Route("/sse/", endpoint=handle_sse),
-        Mount("/messages/", app=transport.handle_post_message),
-    ]
-
-    # Create a Starlette app
-    return Starlette(routes=routes)
\ No newline at end of file
+            batch = _json_loads(body)
+        except ValueError:
+            batch = None
+        if not isinstance(batch, list) or not batch:
+            await transport.handle_post_message(scope, _replay_body(body), send)
+            return
+
+        statuses = []
+        for item in batch:
+            status = 500
+
+            async def capture(message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+            try:
+                await transport.handle_post_message(
+                    scope, _replay_body(_json_dumps(item)), capture
+                )
+            except Exception:
+                logger.exception("Batch message handling error")
+            statuses.append(status)
+
+        overall = 202 if all(s < 400 for s in statuses) else 400
+        response = Response(
+            _json_dumps({"batch": len(statuses), "statuses": statuses}),
+            status_code=overall,
+            media_type="application/json",
+        )
+        await response(scope, receive, send)
+
+    # Single ASGI dispatcher in place of the Starlette router and the 404
+    # gate that fronted it: with exactly two fixed paths, a pair of prefix
+    # checks dispatches faster than route matching, and POSTs reach the
+    # transport handler with no shim at all. handle_sse keeps its Request
+    # interface via a thin adapter.
+    async def dispatch(scope, receive, send):
+        scope_type = scope["type"]
+        if scope_type == "http":
+            path = scope["path"]
+            if path.startswith("/messages/"):
+                await post_messages(scope, receive, send)
+            elif path.startswith("/sse/"):
+                response = await handle_sse(Request(scope, receive, send))
+                if response is not None:
+                    await response(scope, receive, send)
+            else:
+                await send(_not_found_start())
+                await send(_NOT_FOUND_BODY)
+        elif scope_type == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    dispatch.state = SimpleNamespace(
+        uvicorn_kwargs={
+            "loop": _UVICORN_LOOP,
+            "http": _UVICORN_HTTP,
+            "ws": "none",
+        }
+    )
+    return dispatch
\ No newline at end of file